@@ -12,6 +12,7 @@ from tqdm.contrib.itertools import product
 from zampy.datasets import converter
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
+from zampy.datasets.utils import chunk_sizes
 from zampy.datasets.utils import get_file_size
 from zampy.reference.variables import VARIABLE_REFERENCE_LOOKUP
 
@@ -391,6 +392,12 @@ def convert_to_zampy(
         ds = parse_nc_file(file)
         # Rename the vswl data:
         ncfile = Path(str(ncfile).replace("volumetric_soil_water", "soil_moisture"))
+        # keep the encoding of the downloaded file, but write chunk-aligned blocks.
+        # The files hold many (hourly) time steps, so a chunk per step is too small.
+        for variable in ds.data_vars:
+            ds[variable].encoding["chunksizes"] = chunk_sizes(
+                ds[variable], time_chunk=None
+            )
         ds.to_netcdf(path=ncfile, engine="h5netcdf")
 
 
@@ -444,8 +451,22 @@ def parse_nc_file(file: Path) -> xr.Dataset:
         CF/Zampy formatted xarray Dataset
     """
     # Open chunked: will be dask array -> file writing can be parallelized.
-    ds = xr.open_dataset(file, chunks={"x": 50, "y": 50}, engine="h5netcdf")
+    ds = xr.open_dataset(
+        file, chunks={"latitude": 50, "longitude": 50}, engine="h5netcdf"
+    )
+
+    return parse_dataset(ds)
+
+
+def parse_dataset(ds: xr.Dataset) -> xr.Dataset:
+    """Parse an opened ERA5 dataset, to CF/Zampy standard dataset.
 
+    Args:
+        ds: Dataset opened from an ERA5 nc file.
+
+    Returns:
+        CF/Zampy formatted xarray Dataset
+    """
     for variable in ds.variables:
         if variable in var_reference_ecmwf_to_zampy:
             var = str(variable)  # Cast to string to please mypy
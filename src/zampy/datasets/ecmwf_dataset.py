@@ -154,7 +154,9 @@ class ECMWFDataset:  # noqa: D101
         for file in data_files:
             # start conversion process
             print(f"Start processing file `{file.name}`.")
-            ds = xr.open_dataset(file, chunks={"x": 50, "y": 50}, engine="h5netcdf")
+            ds = xr.open_dataset(
+                file, chunks={"latitude": 50, "longitude": 50}, engine="h5netcdf"
+            )
             ds = converter.convert(ds, dataset=self, convention=convention)
             # TODO: support derived variables
             # TODO: other calculations
@@ -161,7 +161,9 @@ class EthCanopyHeight:  # noqa: D101
         for file in data_files:
             # start conversion process
             print(f"Start processing file `{file.name}`.")
-            ds = xr.open_dataset(file, chunks={"x": 2000, "y": 2000}, engine="h5netcdf")
+            ds = xr.open_dataset(
+                file, chunks={"latitude": 2000, "longitude": 2000}, engine="h5netcdf"
+            )
             ds = converter.convert(ds, dataset=self, convention=convention)
             # TODO: support derived variables
             # TODO: other calculations
@@ -251,7 +253,12 @@ def convert_tiff_to_netcdf(
         ds = ds.interpolate_na(dim="longitude", limit=1)
         ds = ds.interpolate_na(dim="latitude", limit=1)
 
-        ds.to_netcdf(path=ncfile, encoding=ds.encoding, engine="h5netcdf")
+        # chunk-aligned and uncompressed, so loading the file stays cheap
+        encoding = {
+            variable: {"chunksizes": utils.chunk_sizes(ds[variable])}
+            for variable in ds.data_vars
+        }
+        ds.to_netcdf(path=ncfile, encoding=encoding, engine="h5netcdf")
 
 
 def parse_tiff_file(file: Path, sd_file: bool = False) -> xr.Dataset:
@@ -149,7 +149,7 @@ class FaparLAI:  # noqa: D101
         resolution: float,
         variable_names: list[str],
     ) -> xr.Dataset:
-        files = list((ingest_dir / self.name).glob("*.nc"))
+        files = sorted((ingest_dir / self.name).glob("*.nc"))
         ds = xr.open_mfdataset(files, engine="h5netcdf")  # see issue 65
         ds = ds.sel(time=slice(time_bounds.start, time_bounds.end))
 
@@ -263,7 +263,11 @@ def ingest_ncfile(ncfile: Path, ingest_folder: Path) -> None:
     ds["leaf_area_index"].attrs["units"] = "fraction"
     ds[["leaf_area_index"]].to_netcdf(
         path=ingest_folder / ncfile.name,
-        encoding={"leaf_area_index": {"zlib": True, "complevel": 3}},
+        encoding={
+            "leaf_area_index": {
+                "chunksizes": utils.chunk_sizes(ds["leaf_area_index"]),
+            }
+        },
         engine="h5netcdf",
     )
     ds.close()  # explicitly close to release file to system (for Windows)
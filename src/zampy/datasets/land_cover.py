@@ -1,5 +1,6 @@
 """Land cover classification dataset."""
 
+import io
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile
@@ -20,6 +21,10 @@ from zampy.reference.variables import VARIABLE_REFERENCE_LOOKUP
 from zampy.reference.variables import unit_registry
 
 
+# Archived files up to this size are read into memory, larger ones are extracted to disk
+IN_MEMORY_MAX_SIZE = 64 * 1024**2  # bytes
+
+
 ## Ignore missing class/method docstrings: they are implemented in the Dataset class.
 # ruff: noqa: D102
 
@@ -199,7 +204,7 @@ def unzip_raw_to_netcdf(
         print(f"File '{ncfile.name}' already exists, skipping...")
     else:
         ds = extract_netcdf_to_zampy(file)
-        ds.to_netcdf(path=ncfile, engine="h5netcdf")
+        ds.to_netcdf(path=ncfile, encoding=ds.encoding, engine="h5netcdf")
 
 
 def extract_netcdf_to_zampy(file: Path) -> xr.Dataset:
@@ -216,13 +221,18 @@ def extract_netcdf_to_zampy(file: Path) -> xr.Dataset:
         Coarse land cover data in zampy format.
     """
     with TemporaryDirectory() as temp_dir:
-        unzip_folder = Path(temp_dir)
         with ZipFile(file, "r") as zip_object:
             zipped_file_name = zip_object.namelist()[0]
-            zip_object.extract(zipped_file_name, path=unzip_folder)
+            source: io.BytesIO | str
+            if zip_object.getinfo(zipped_file_name).file_size <= IN_MEMORY_MAX_SIZE:
+                # small files are read into memory, skipping the write to disk
+                with zip_object.open(zipped_file_name) as zipped_file:
+                    source = io.BytesIO(zipped_file.read())
+            else:
+                source = zip_object.extract(zipped_file_name, path=temp_dir)
 
         # only keep land cover class variable
-        with xr.open_dataset(unzip_folder / zipped_file_name, engine="h5netcdf") as ds:
+        with xr.open_dataset(source, engine="h5netcdf") as ds:
             var_list = list(ds.data_vars)
             raw_variable = "lccs_class"
             var_list.remove(raw_variable)
@@ -255,15 +265,28 @@ def extract_netcdf_to_zampy(file: Path) -> xr.Dataset:
             # convert dataarray to dataset
             ds_regrid = da_regrid.to_dataset()
 
-        # rename variable to follow the zampy convention
-        variable_name = "land_cover"
-        ds_regrid = ds_regrid.rename({raw_variable: variable_name})
-        ds_regrid[variable_name].attrs["units"] = str(
-            VARIABLE_REFERENCE_LOOKUP[variable_name].unit
-        )
-        ds_regrid[variable_name].attrs["description"] = VARIABLE_REFERENCE_LOOKUP[
-            variable_name
-        ].desc
+    # rename variable to follow the zampy convention
+    variable_name = "land_cover"
+    ds_regrid = ds_regrid.rename({raw_variable: variable_name})
+    ds_regrid[variable_name].attrs["units"] = str(
+        VARIABLE_REFERENCE_LOOKUP[variable_name].unit
+    )
+    ds_regrid[variable_name].attrs["description"] = VARIABLE_REFERENCE_LOOKUP[
+        variable_name
+    ].desc
+    # chunk the file like `LandCover.load` reads it, light compression suffices
+    # for the repetitive land cover classes. All LCCS classes fit in a single byte.
+    ds_regrid.encoding = {
+        variable_name: {
+            "dtype": "uint8",
+            "chunksizes": utils.chunk_sizes(
+                ds_regrid[variable_name], spatial_chunk=200
+            ),
+            "zlib": True,
+            "complevel": 1,
+            "shuffle": True,
+        }
+    }
 
     return ds_regrid
 
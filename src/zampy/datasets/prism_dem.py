@@ -265,10 +265,13 @@ def read_raw_dem(file: Path) -> xr.Dataset:
                 variable_name
             ].desc
 
+    # square tiles, so reading a small bounding box only decompresses a few chunks
     ds.encoding = {
         "elevation": {
+            "chunksizes": utils.chunk_sizes(ds["elevation"], spatial_chunk=256),
             "zlib": True,
-            "complevel": 5,
+            "complevel": 1,
+            "shuffle": True,
         }
     }
     return ds
@@ -1,13 +1,21 @@
 """Shared utilities from datasets."""
 
+import math
 import urllib.request
 from pathlib import Path
 import requests
+import xarray as xr
 import xarray_regrid
 from tqdm import tqdm
 from zampy.datasets.dataset_protocol import SpatialBounds
 
 
+# names of the time dimension, ECMWF files use `valid_time`
+TIME_DIMS = ("time", "valid_time")
+# 4 MiB of float32 values
+CHUNK_MAX_ELEMENTS = 2**20
+
+
 class TqdmUpdate(tqdm):
     """Wrap a tqdm progress bar to be updateable by urllib.request.urlretrieve."""
 
@@ -70,3 +78,33 @@ def make_grid(spatial_bounds: SpatialBounds, resolution: float) -> xarray_regrid
         resolution_lat=resolution,
         resolution_lon=resolution,
     )
+
+
+def chunk_sizes(
+    da: xr.DataArray, spatial_chunk: int = 128, time_chunk: int | None = 1
+) -> tuple[int, ...]:
+    """Return netCDF chunk sizes of blocks of time steps and square spatial blocks.
+
+    Args:
+        da: DataArray to be written to a netCDF file.
+        spatial_chunk: Chunk size along the non-time dimensions. Dimensions that are
+            smaller than this are stored as a single chunk.
+        time_chunk: Number of time steps per chunk. If None, as many time steps as
+            fit in a chunk of `CHUNK_MAX_ELEMENTS` values are used.
+
+    Returns:
+        Chunk sizes, in the order of the dimensions of `da`.
+    """
+    chunks = {
+        dim: size if dim in TIME_DIMS else min(size, spatial_chunk)
+        for dim, size in da.sizes.items()
+    }
+    if time_chunk is None:
+        spatial_elements = math.prod(
+            size for dim, size in chunks.items() if dim not in TIME_DIMS
+        )
+        time_chunk = max(1, CHUNK_MAX_ELEMENTS // spatial_elements)
+    return tuple(
+        min(size, time_chunk) if dim in TIME_DIMS else size
+        for dim, size in chunks.items()
+    )
@@ -19,6 +19,19 @@ def recipe_loader(recipe_path: Path) -> dict:
     with recipe_path.open() as f:
         recipe: dict = yaml.safe_load(f)
 
+    validate_recipe(recipe)
+    return recipe
+
+
+def validate_recipe(recipe: dict) -> None:
+    """Validate the contents of a (parsed) recipe.
+
+    Args:
+        recipe: Recipe loaded into a dictionary.
+
+    Raises:
+        ValueError: If any of the required recipe items are missing.
+    """
     if not all(key in recipe.keys() for key in ["name", "download", "convert"]):
         msg = (
             "One of the following items are missing from the recipe:\n"
@@ -40,8 +53,6 @@ def recipe_loader(recipe_path: Path) -> dict:
         )
         raise ValueError(msg)
 
-    return recipe
-
 
 def config_loader() -> dict:
     """Load the zampty config and validate the contents."""
@@ -1,6 +1,10 @@
 """This module contains all tests for datasets included in zampy."""
 
+import functools
+import json
 from pathlib import Path
+import numpy as np
+import xarray as xr
 from zampy.recipe import config_loader
 from . import generate_test_data
 
@@ -23,6 +27,28 @@ ALL_HOURS = [
 ]  # fmt: skip
 
 
+@functools.lru_cache
+def _read_properties(path: Path, mtime: float) -> dict:
+    with path.open(mode="r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def read_properties(dataset_folder: Path) -> dict:
+    """Read the properties.json file in a dataset folder.
+
+    The parsed file is cached on its path and modification time, so repeated reads of
+    an unchanged file do not hit the disk.
+    """
+    path = dataset_folder / "properties.json"
+    return dict(_read_properties(path, path.stat().st_mtime))
+
+
+def assert_coords(ds: xr.Dataset, expected_lat, expected_lon) -> None:
+    """Assert that the latitude and longitude of a dataset match the expected values."""
+    np.testing.assert_allclose(ds["latitude"].values, expected_lat)
+    np.testing.assert_allclose(ds["longitude"].values, expected_lon)
+
+
 if not data_folder.exists():
     # This should be run locally!
     # Generate test data if it does not exist
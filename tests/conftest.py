@@ -0,0 +1,97 @@
+"""Shared fixtures for the zampy tests."""
+
+import functools
+from pathlib import Path
+import pytest
+import xarray as xr
+from zampy.datasets import cds_utils
+from zampy.datasets.catalog import EthCanopyHeight
+from zampy.datasets.eth_canopy_height import parse_tiff_file
+from . import data_folder
+
+
+COMPRESSION_KEYS = ("zlib", "complevel", "compression", "compression_opts", "shuffle")
+
+
+def _strip_compression(encoding: dict) -> dict:
+    return {key: val for key, val in encoding.items() if key not in COMPRESSION_KEYS}
+
+
+@pytest.fixture(scope="session")
+def valid_path_config(tmp_path_factory):
+    """Create a dummy .zampy_config file."""
+    fn = tmp_path_factory.mktemp("usrhome") / "zampy_config.yml"
+    with open(fn, mode="w", encoding="utf-8") as f:
+        f.write("cdsapi:\n  url: a\n  key: 123:abc-def\n")
+        f.write("adsapi:\n  url: a\n  key: 123:abc-def")
+    return fn
+
+
+@pytest.fixture(scope="session")
+def eth_canopy_height_dataset():
+    """ETH canopy height dataset instance shared by all tests."""
+    return EthCanopyHeight()
+
+
+@pytest.fixture(scope="session")
+def eth_canopy_tile():
+    """Dummy ETH canopy height tile, parsed and loaded once per test session.
+
+    Tests which modify the dataset should work on a (shallow) copy.
+    """
+    ds = parse_tiff_file(
+        data_folder
+        / "eth-canopy-height"
+        / "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif"
+    )
+    return ds.load()
+
+
+@pytest.fixture(scope="function")
+def dummy_dir(tmp_path_factory):
+    """Create a dummpy directory for testing."""
+    return tmp_path_factory.mktemp("data")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_compression():
+    """Write netCDF files without compression during the tests.
+
+    Files written by the tests are removed afterwards, so compressing them only costs
+    CPU time. The fixture is session-scoped, so it is already active when the
+    module-scoped ingest fixtures write their files.
+    """
+    to_netcdf = xr.Dataset.to_netcdf
+
+    def to_netcdf_uncompressed(self, *args, encoding=None, **kwargs):
+        ds = self.copy(deep=False)
+        for var in ds.variables.values():
+            var.encoding = _strip_compression(var.encoding)
+        if encoding is not None:
+            encoding = {
+                name: _strip_compression(var_encoding)
+                for name, var_encoding in encoding.items()
+            }
+        return to_netcdf(ds, *args, encoding=encoding, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(xr.Dataset, "to_netcdf", to_netcdf_uncompressed)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cache_parse_nc_file():
+    """Parse each ECMWF netCDF file only once per test session.
+
+    The test input files are read-only, so `cds_utils.parse_nc_file` is wrapped in an
+    LRU cache. Shallow copies of the (lazy) parsed datasets are returned, so callers
+    can modify them without affecting the cache.
+    """
+    parse_nc_file = functools.lru_cache(maxsize=32)(cds_utils.parse_nc_file)
+
+    def parse_nc_file_cached(file: Path) -> xr.Dataset:
+        return parse_nc_file(Path(file)).copy(deep=False)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cds_utils, "parse_nc_file", parse_nc_file_cached)
+        yield
@@ -30,7 +30,7 @@ TEST_DATA_NAME = {
 
 
 def _subset_ncfile(input_file, output_file):
-    ds = xr.open_dataset(input_file)
+    ds = xr.open_dataset(input_file, engine="h5netcdf")
     subset = ds.isel(
         valid_time=slice(0, min(4, ds.valid_time.size)),
         latitude=slice(0, min(4, ds.latitude.size)),
@@ -58,7 +58,7 @@ def _subset_zipfile_include_ncfiles(input_file, output_dir):
     ncfiles = output_dir.glob("*.nc")
 
     for ncfile in ncfiles:
-        ds = xr.open_dataset(ncfile)
+        ds = xr.open_dataset(ncfile, engine="h5netcdf")
         # select a subset of the data
         subset = ds.isel(
             time=slice(0, min(100, ds.time.size)),
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from unittest.mock import patch
+import h5netcdf
 import numpy as np
 import pytest
 import xarray as xr
@@ -11,106 +12,76 @@ from zampy.datasets.dataset_protocol import TimeBounds
 from . import ALL_DAYS
 from . import ALL_HOURS
 from . import data_folder
+from . import test_folder
 
 
-@pytest.fixture(scope="function")
-def valid_path_config(tmp_path_factory):
-    """Create a dummy .zampy_config file."""
-    fn = tmp_path_factory.mktemp("usrhome") / "zampy_config.yml"
-    with open(fn, mode="w", encoding="utf-8") as f:
-        f.write("cdsapi:\n  url: a\n  key: 123:abc-def\n")
-        f.write("adsapi:\n  url: a\n  key: 123:abc-def")
-    return fn
-
-
-@patch("cdsapi.Client.retrieve")
-def test_cds_request_era5(mock_retrieve, valid_path_config):
-    """ "Test cds request for downloading data from CDS server."""
-    product = "reanalysis-era5-single-levels"
-    variables = ["eastward_component_of_wind"]
-    cds_var_names = {"eastward_component_of_wind": "10m_u_component_of_wind"}
-    time_bounds = TimeBounds(
-        np.datetime64("2010-01-01T00:00:00"), np.datetime64("2010-01-31T23:00:00")
-    )
-    spatial_bounds = SpatialBounds(54, 56, 1, 3)
-    path = Path(__file__).resolve().parent
-    overwrite = True
-
-    # create a dummy .cdsapirc
-    patching = patch("zampy.datasets.cds_utils.CONFIG_PATH", valid_path_config)
-    with patching:
-        cds_utils.cds_request(
-            product,
-            variables,
-            time_bounds,
-            spatial_bounds,
-            path,
-            cds_var_names,
-            overwrite,
-        )
+CDS_BBOX = SpatialBounds(54, 56, 1, 3)
+CDS_AREA = [CDS_BBOX.north, CDS_BBOX.west, CDS_BBOX.south, CDS_BBOX.east]
 
-        mock_retrieve.assert_called_with(
-            product,
-            {
-                "product_type": "reanalysis",
-                "variable": ["10m_u_component_of_wind"],
-                "year": "2010",
-                "month": "1",
-                "day": ALL_DAYS,
-                "time": ALL_HOURS,
-                "area": [
-                    spatial_bounds.north,
-                    spatial_bounds.west,
-                    spatial_bounds.south,
-                    spatial_bounds.east,
-                ],
-                "format": "netcdf",
-            },
-        )
+# product, zampy to CDS variable names, time bounds, expected request
+CDS_REQUEST_CASES = [
+    (
+        "reanalysis-era5-single-levels",
+        {"eastward_component_of_wind": "10m_u_component_of_wind"},
+        TimeBounds(
+            np.datetime64("2010-01-01T00:00:00"), np.datetime64("2010-01-31T23:00:00")
+        ),
+        {
+            "product_type": "reanalysis",
+            "variable": ["10m_u_component_of_wind"],
+            "year": "2010",
+            "month": "1",
+            "day": ALL_DAYS,
+            "time": ALL_HOURS,
+            "area": CDS_AREA,
+            "format": "netcdf",
+        },
+    ),
+    (
+        "cams-global-ghg-reanalysis-egg4",
+        {"co2_concentration": "carbon_dioxide"},
+        TimeBounds(
+            np.datetime64("2003-01-02T00:00:00"), np.datetime64("2003-01-04T00:00:00")
+        ),
+        {
+            "model_level": "60",
+            "variable": ["carbon_dioxide"],
+            "date": "2003-01-02/2003-01-04",
+            "step": ["0", "3", "6", "9", "12", "15", "18", "21"],
+            "area": CDS_AREA,
+            "format": "netcdf",
+        },
+    ),
+]
 
 
+@pytest.mark.parametrize(
+    "product, cds_var_names, time_bounds, expected_request", CDS_REQUEST_CASES
+)
 @patch("cdsapi.Client.retrieve")
-def test_cds_request_cams_co2(mock_retrieve, valid_path_config):
+def test_cds_request(  # noqa: PLR0917
+    mock_retrieve,
+    valid_path_config,
+    product,
+    cds_var_names,
+    time_bounds,
+    expected_request,
+):
     """ "Test cds request for downloading data from CDS server."""
-    product = "cams-global-ghg-reanalysis-egg4"
-    variables = ["co2_concentration"]
-    cds_var_names = {"co2_concentration": "carbon_dioxide"}
-    time_bounds = TimeBounds(
-        np.datetime64("2003-01-02T00:00:00"), np.datetime64("2003-01-04T00:00:00")
-    )
-    spatial_bounds = SpatialBounds(54, 56, 1, 3)
-    path = Path(__file__).resolve().parent
-    overwrite = True
-
     # create a dummy .cdsapirc
     patching = patch("zampy.datasets.cds_utils.CONFIG_PATH", valid_path_config)
     with patching:
         cds_utils.cds_request(
-            product,
-            variables,
-            time_bounds,
-            spatial_bounds,
-            path,
-            cds_var_names,
-            overwrite,
+            dataset=product,
+            variables=list(cds_var_names),
+            time_bounds=time_bounds,
+            spatial_bounds=CDS_BBOX,
+            path=test_folder,
+            cds_var_names=cds_var_names,
+            overwrite=True,
         )
 
-        mock_retrieve.assert_called_with(
-            product,
-            {
-                "model_level": "60",
-                "variable": [cds_var_names["co2_concentration"]],
-                "date": "2003-01-02/2003-01-04",
-                "step": ["0", "3", "6", "9", "12", "15", "18", "21"],
-                "area": [
-                    spatial_bounds.north,
-                    spatial_bounds.west,
-                    spatial_bounds.south,
-                    spatial_bounds.east,
-                ],
-                "format": "netcdf",
-            },
-        )
+        mock_retrieve.assert_called_with(product, expected_request)
 
 
 @patch("cdsapi.Client.retrieve")
@@ -120,7 +91,7 @@ def test_cds_request_land_cover(mock_retrieve, valid_path_config):
     time_bounds = TimeBounds(
         np.datetime64("2020-01-01T00:00:00"), np.datetime64("2020-12-31T00:00:00")
     )
-    path = Path(__file__).resolve().parent
+    path = test_folder
     overwrite = True
 
     # create a dummy .cdsapirc
@@ -130,7 +101,7 @@ def test_cds_request_land_cover(mock_retrieve, valid_path_config):
             dataset,
             time_bounds,
             path,
-            SpatialBounds(54, 56, 1, 3),
+            CDS_BBOX,
             overwrite,
         )
 
@@ -141,7 +112,7 @@ def test_cds_request_land_cover(mock_retrieve, valid_path_config):
             "format": "zip",
             "year": "2020",
             "version": "v2_1_1",
-            "area": [54, 3, 1, 56],
+            "area": CDS_AREA,
         },
     )
 
@@ -174,12 +145,6 @@ def test_time_bounds_to_year_month():
     assert expected == year_month_pairs
 
 
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
-
-
 def test_convert_to_zampy(dummy_dir):
     """Test function for converting file to zampy format."""
     ingest_folder = Path(data_folder, "era5")
@@ -189,101 +154,96 @@ def test_convert_to_zampy(dummy_dir):
         overwrite=True,
     )
 
-    ds = xr.open_dataset(Path(dummy_dir, "era5_northward_component_of_wind_2020-1.nc"))
-
-    assert list(ds.data_vars)[0] == "northward_component_of_wind"
-
-
-class TestParser:
+    # only the variable names and attributes are checked, so skip xarray's decoding
+    with h5netcdf.File(
+        Path(dummy_dir, "era5_northward_component_of_wind_2020-1.nc"), mode="r"
+    ) as file:
+        assert "northward_component_of_wind" in file.variables
+        assert "v10" not in file.variables
+        assert file["northward_component_of_wind"].attrs["units"] == "meter_per_second"
+
+
+# file, parsed variable name, units, (original variable name, scale factor)
+PARSER_CASES = [
+    (
+        "era5/era5_northward_component_of_wind_2020-1.nc",
+        "northward_component_of_wind",
+        "meter_per_second",
+        None,
+    ),
+    (
+        "era5/era5_eastward_component_of_wind_2020-1.nc",
+        "eastward_component_of_wind",
+        "meter_per_second",
+        None,
+    ),
+    (
+        "era5/era5_surface_thermal_radiation_downwards_2020-1.nc",
+        "surface_thermal_radiation_downwards",
+        "watt_per_square_meter",
+        ("strd", 3600),
+    ),
+    (
+        "era5/era5_surface_solar_radiation_downwards_2020-1.nc",
+        "surface_solar_radiation_downwards",
+        "watt_per_square_meter",
+        ("ssrd", 3600),
+    ),
+    (
+        "era5/era5_total_precipitation_2020-1.nc",
+        "total_precipitation",
+        "millimeter_per_second",
+        ("mtpr", cds_utils.WATER_DENSITY / 1000),
+    ),
+    (
+        "era5/era5_surface_pressure_2020-1.nc",
+        "surface_pressure",
+        "pascal",
+        None,
+    ),
+    (
+        "era5-land/era5-land_air_temperature_2020-1.nc",
+        "air_temperature",
+        "kelvin",
+        None,
+    ),
+    (
+        "era5-land/era5-land_dewpoint_temperature_2020-1.nc",
+        "dewpoint_temperature",
+        "kelvin",
+        None,
+    ),
+    (
+        "cams/cams_co2_concentration_2020_01_01-2020_02_15.nc",
+        "co2_concentration",
+        "fraction",
+        None,
+    ),
+]
+
+
+@pytest.mark.parametrize("fname, expected_var_name, units, original", PARSER_CASES)
+def test_parse_nc_file(fname, expected_var_name, units, original):
     """Test parsing netcdf files for all relevant variables."""
+    # parse the raw dataset, so the original values are compared without a second read.
+    # Decoding the values and times is only needed when the values are compared.
+    decode = original is not None
+    with xr.open_dataset(
+        data_folder / fname,
+        engine="h5netcdf",
+        mask_and_scale=decode,
+        decode_times=decode,
+    ) as ds_raw:
+        ds = cds_utils.parse_dataset(ds_raw)
 
-    def test_parse_nc_file_10m_wind(self):
-        """Test parsing netcdf file function with 10 meter velocity u/v component."""
-        variables = ["northward_component_of_wind", "eastward_component_of_wind"]
-        for variable in variables:
-            ds = cds_utils.parse_nc_file(
-                data_folder / "era5" / f"era5_{variable}_2020-1.nc"
-            )
-            expected_var_name = variable
-            assert list(ds.data_vars)[0] == expected_var_name
-            assert ds[expected_var_name].attrs["units"] == "meter_per_second"
-
-    def test_parse_nc_file_radiation(self):
-        """Test parsing netcdf file function with surface radiation."""
-        variables = {
-            "surface_thermal_radiation_downwards": "strd",
-            "surface_solar_radiation_downwards": "ssrd",
-        }
-        for variable in variables:
-            ds_original = xr.open_dataset(
-                data_folder / "era5" / f"era5_{variable}_2020-1.nc"
-            )
-            ds = cds_utils.parse_nc_file(
-                data_folder / "era5" / f"era5_{variable}_2020-1.nc"
-            )
-
-            assert list(ds.data_vars)[0] == variable
-            assert ds[variable].attrs["units"] == "watt_per_square_meter"
-            assert np.allclose(
-                ds_original[variables[variable]].values,
-                ds[variable].values * 3600,
+        assert list(ds.data_vars)[0] == expected_var_name
+        assert ds[expected_var_name].attrs["units"] == units
+
+        if original is not None:
+            original_var_name, scale = original
+            np.testing.assert_allclose(
+                ds_raw[original_var_name].values,
+                ds[expected_var_name].values * scale,
+                rtol=1e-6,  # float32 round-off of the scaling
                 equal_nan=True,
             )
-
-    def test_parse_nc_file_precipitation(self):
-        """Test parsing netcdf file function with precipitation."""
-        ds_original = xr.open_dataset(
-            data_folder / "era5" / "era5_total_precipitation_2020-1.nc"
-        )
-        ds = cds_utils.parse_nc_file(
-            data_folder / "era5" / "era5_total_precipitation_2020-1.nc"
-        )
-        expected_var_name = "total_precipitation"
-
-        assert list(ds.data_vars)[0] == expected_var_name
-        assert ds["total_precipitation"].attrs["units"] == "millimeter_per_second"
-        assert np.allclose(
-            ds_original["mtpr"].values,
-            ds["total_precipitation"].values * cds_utils.WATER_DENSITY / 1000,
-            equal_nan=True,
-        )
-
-    def test_parse_nc_file_pressure(self):
-        """Test parsing netcdf file function with surface pressure."""
-        ds = cds_utils.parse_nc_file(
-            data_folder / "era5" / "era5_surface_pressure_2020-1.nc"
-        )
-        expected_var_name = "surface_pressure"
-
-        assert list(ds.data_vars)[0] == expected_var_name
-        assert ds["surface_pressure"].attrs["units"] == "pascal"
-
-    def test_parse_nc_file_air_temperature(self):
-        """Test parsing netcdf file function with 2 meter temperature."""
-        ds = cds_utils.parse_nc_file(
-            data_folder / "era5-land" / "era5-land_air_temperature_2020-1.nc"
-        )
-        expected_var_name = "air_temperature"
-
-        assert list(ds.data_vars)[0] == expected_var_name
-        assert ds["air_temperature"].attrs["units"] == "kelvin"
-
-    def test_parse_nc_file_dew_temperature(self):
-        """Test parsing netcdf file function with 2 meter dewpoint temperature."""
-        ds = cds_utils.parse_nc_file(
-            data_folder / "era5-land" / "era5-land_dewpoint_temperature_2020-1.nc"
-        )
-        expected_var_name = "dewpoint_temperature"
-
-        assert list(ds.data_vars)[0] == expected_var_name
-        assert ds["dewpoint_temperature"].attrs["units"] == "kelvin"
-
-    def test_parse_nc_file_co2_concentration(self):
-        """Test parsing netcdf file function with co2 concentration."""
-        ds = cds_utils.parse_nc_file(
-            data_folder / "cams" / "cams_co2_concentration_2020_01_01-2020_02_15.nc"
-        )
-        expected_var_name = "co2_concentration"
-
-        assert list(ds.data_vars)[0] == expected_var_name
-        assert ds["co2_concentration"].attrs["units"] == "fraction"
@@ -6,12 +6,8 @@ import pytest
 import xarray as xr
 from zampy.datasets import converter
 from zampy.datasets.catalog import EthCanopyHeight
-from zampy.datasets.eth_canopy_height import parse_tiff_file
-from . import data_folder
 
 
-path_dummy_data = data_folder / "eth-canopy-height"
-
 # ruff: noqa: B018
 
 
@@ -27,11 +23,9 @@ def test_check_convention_not_exist():
         converter.check_convention(convention)
 
 
-def test_convert_var():
+def test_convert_var(eth_canopy_tile):
     """Test _convert_var function."""
-    ds = parse_tiff_file(
-        path_dummy_data / "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif",
-    )
+    ds = eth_canopy_tile
     ds_convert = converter._convert_var(ds, "height_of_vegetation", "decimeter")
 
     assert np.allclose(
@@ -41,14 +35,12 @@ def test_convert_var():
     )
 
 
-def test_convert_var_name():
+def test_convert_var_name(eth_canopy_tile):
     """Test convert function.
 
     In this test, no unit-conversion is performed. Only the variable name is updated.
     """
-    ds = parse_tiff_file(
-        path_dummy_data / "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif",
-    )
+    ds = eth_canopy_tile
     ds_convert = converter.convert(
         data=ds, dataset=EthCanopyHeight(), convention="ALMA"
     )
@@ -56,14 +48,13 @@ def test_convert_var_name():
     assert list(ds_convert.data_vars)[0] == "Hveg"
 
 
-def test_convert_unit():
+def test_convert_unit(eth_canopy_tile):
     """Test convert function.
 
     In this test, unit conversion is performed.
     """
-    ds = parse_tiff_file(
-        path_dummy_data / "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif",
-    )
+    # shallow copy, so changing the units leaves the shared dataset intact
+    ds = eth_canopy_tile.copy(deep=False)
     ds["height_of_vegetation"].attrs["units"] = "decimeter"
     ds_convert = converter.convert(
         data=ds, dataset=EthCanopyHeight(), convention="ALMA"
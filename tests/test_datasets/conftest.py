@@ -0,0 +1,31 @@
+"""Shared fixtures for the dataset tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+import pytest
+from tests import data_folder
+from zampy.datasets.dataset_protocol import Dataset
+
+
+@pytest.fixture(scope="session")
+def ingest_dataset(
+    tmp_path_factory,
+) -> Callable[[type[Dataset]], tuple[Path, Dataset]]:
+    """Ingest the dummy data of a dataset only once per test session.
+
+    Returns a function which takes a dataset class, ingests the test data of that
+    dataset into a temporary directory and returns the ingest directory and the
+    dataset instance. Both are cached on the dataset class, so tests should not
+    modify the ingested files.
+    """
+    ingested: dict[type[Dataset], tuple[Path, Dataset]] = {}
+
+    def ingest(dataset_class: type[Dataset]) -> tuple[Path, Dataset]:
+        if dataset_class not in ingested:
+            dataset = dataset_class()
+            ingest_dir = tmp_path_factory.mktemp(f"{dataset.name}_ingest")
+            dataset.ingest(download_dir=data_folder, ingest_dir=ingest_dir)
+            ingested[dataset_class] = (ingest_dir, dataset)
+        return ingested[dataset_class]
+
+    return ingest
@@ -0,0 +1,109 @@
+"""Unit test for the download of ECMWF datasets."""
+
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pytest
+from tests import ALL_DAYS
+from tests import ALL_HOURS
+from tests import read_properties
+from zampy.datasets.catalog import CAMS
+from zampy.datasets.catalog import ERA5
+from zampy.datasets.catalog import ERA5Land
+from zampy.datasets.dataset_protocol import SpatialBounds
+from zampy.datasets.dataset_protocol import TimeBounds
+
+
+BBOX = SpatialBounds(60, 10, 50, 0)
+AREA = [BBOX.north, BBOX.west, BBOX.south, BBOX.east]
+
+DOWNLOAD_CASES = [
+    (
+        ERA5,
+        TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-02-15")),
+        ["eastward_component_of_wind"],
+        "reanalysis-era5-single-levels",
+        {
+            "product_type": "reanalysis",
+            "variable": ["10m_u_component_of_wind"],
+            "year": "2020",
+            "month": "1",
+            "day": ALL_DAYS,
+            "time": ALL_HOURS,
+            "area": AREA,
+            "format": "netcdf",
+        },
+    ),
+    (
+        ERA5Land,
+        TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-02-15")),
+        ["dewpoint_temperature"],
+        "reanalysis-era5-land",
+        {
+            "product_type": "reanalysis",
+            "variable": ["2m_dewpoint_temperature"],
+            "year": "2020",
+            "month": "1",
+            "day": ALL_DAYS,
+            "time": ALL_HOURS,
+            "area": AREA,
+            "format": "netcdf",
+        },
+    ),
+    (
+        CAMS,
+        TimeBounds(np.datetime64("2003-01-02"), np.datetime64("2003-01-04")),
+        ["co2_concentration"],
+        "cams-global-ghg-reanalysis-egg4",
+        {
+            "model_level": "60",
+            "variable": ["carbon_dioxide"],
+            "date": "2003-01-02/2003-01-04",
+            "step": ["0", "3", "6", "9", "12", "15", "18", "21"],
+            "area": AREA,
+            "format": "netcdf",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "dataset_cls, times, variable, expected_endpoint, expected_request",
+    DOWNLOAD_CASES,
+)
+@patch("cdsapi.Client.retrieve")
+def test_download(  # noqa: PLR0917
+    mock_retrieve,
+    valid_path_config,
+    dummy_dir,
+    dataset_cls,
+    times,
+    variable,
+    expected_endpoint,
+    expected_request,
+):
+    """Test download functionality.
+    Here we mock the downloading and save property file to a fake path.
+    """
+    download_dir = Path(dummy_dir, "download")
+
+    dataset = dataset_cls()
+    # create a dummy .cdsapirc
+    patching = patch("zampy.datasets.cds_utils.CONFIG_PATH", valid_path_config)
+    with patching:
+        dataset.download(
+            download_dir=download_dir,
+            time_bounds=times,
+            spatial_bounds=BBOX,
+            variable_names=variable,
+            overwrite=True,
+        )
+
+        # make sure that the download is called
+        mock_retrieve.assert_called_once()
+        assert mock_retrieve.call_args.args == (expected_endpoint, expected_request)
+        assert mock_retrieve.call_args.kwargs == {}
+
+        # check property file
+        json_dict = read_properties(download_dir / dataset.name)
+        assert json_dict["variable_names"] == variable
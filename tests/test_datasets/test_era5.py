@@ -1,120 +1,50 @@
 """Unit test for ERA5 dataset."""
 
-import json
 from pathlib import Path
-from unittest.mock import patch
 import numpy as np
 import pytest
 import xarray as xr
-from tests import ALL_DAYS
-from tests import ALL_HOURS
-from tests import data_folder
+from tests import assert_coords
 from zampy.datasets.catalog import ERA5
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 
 
-@pytest.fixture(scope="function")
-def valid_path_config(tmp_path_factory):
-    """Create a dummy .zampy_config file."""
-    fn = tmp_path_factory.mktemp("usrhome") / "zampy_config.yml"
-    with open(fn, mode="w", encoding="utf-8") as f:
-        f.write("cdsapi:\n  url: a\n  key: 123:abc-def\n")
-        f.write("adsapi:\n  url: a\n  key: 123:abc-def")
-    return fn
+pytestmark = pytest.mark.xdist_group("era5_io")
 
-
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
+# regridded coordinates expected from test_load
+EXPECTED_LAT = np.array([59.7, 59.8, 59.9])
+EXPECTED_LON = np.array([0.0, 0.1, 0.2])
 
 
 class TestERA5:
     """Test the ERA5 class."""
 
-    @patch("cdsapi.Client.retrieve")
-    def test_download(self, mock_retrieve, valid_path_config, dummy_dir):
-        """Test download functionality.
-        Here we mock the downloading and save property file to a fake path.
-        """
-        times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-02-15"))
-        bbox = SpatialBounds(60, 10, 50, 0)
-        variable = ["eastward_component_of_wind"]
-        cds_var_names = ["10m_u_component_of_wind"]
-        download_dir = Path(dummy_dir, "download")
-
-        era5_dataset = ERA5()
-        # create a dummy .cdsapirc
-        patching = patch("zampy.datasets.cds_utils.CONFIG_PATH", valid_path_config)
-        with patching:
-            era5_dataset.download(
-                download_dir=download_dir,
-                time_bounds=times,
-                spatial_bounds=bbox,
-                variable_names=variable,
-                overwrite=True,
-            )
-
-            # make sure that the download is called
-            mock_retrieve.assert_called_once_with(
-                "reanalysis-era5-single-levels",
-                {
-                    "product_type": "reanalysis",
-                    "variable": cds_var_names,
-                    "year": "2020",
-                    "month": "1",
-                    # fmt: off
-                    "day": ALL_DAYS,
-                    "time": ALL_HOURS,
-                    # fmt: on
-                    "area": [
-                        bbox.north,
-                        bbox.west,
-                        bbox.south,
-                        bbox.east,
-                    ],
-                    "format": "netcdf",
-                },
-            )
-
-            # check property file
-            with (download_dir / "era5" / "properties.json").open(
-                mode="r", encoding="utf-8"
-            ) as file:
-                json_dict = json.load(file)
-                # check property
-                assert json_dict["variable_names"] == variable
-
-    def ingest_dummy_data(self, temp_dir):
-        """Ingest dummy tif data to nc for other tests."""
-        era5_dataset = ERA5()
-        era5_dataset.ingest(download_dir=data_folder, ingest_dir=Path(temp_dir))
-
-        return era5_dataset
-
-    def test_ingest(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_ingest(self, ingest_dataset):
         """Test ingest function."""
-        _ = self.ingest_dummy_data(dummy_dir)
-        ds = xr.open_dataset(
+        ingest_dir, _ = ingest_dataset(ERA5)
+        with xr.open_dataset(
             Path(
-                dummy_dir,
+                ingest_dir,
                 "era5",
                 "era5_northward_component_of_wind_2020-1.nc",
-            )
-        )
-        assert isinstance(ds, xr.Dataset)
+            ),
+            engine="h5netcdf",
+        ) as ds:
+            assert "northward_component_of_wind" in ds.data_vars
 
-    def test_load(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_load(self, ingest_dataset):
         """Test load function."""
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["northward_component_of_wind"]
 
-        era5_dataset = self.ingest_dummy_data(dummy_dir)
+        ingest_dir, era5_dataset = ingest_dataset(ERA5)
 
         ds = era5_dataset.load(
-            ingest_dir=Path(dummy_dir),
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -122,17 +52,14 @@ class TestERA5:
         )
 
         # we assert the regridded coordinates
-        expected_lat = [59.7, 59.8, 59.9]
-        expected_lon = [0.0, 0.1, 0.2]
-
-        np.testing.assert_allclose(ds.latitude.values, expected_lat)
-        np.testing.assert_allclose(ds.longitude.values, expected_lon)
+        assert_coords(ds, EXPECTED_LAT, EXPECTED_LON)
 
         # check if valid_time not in the dataset
         assert "valid_time" not in ds.dims
 
-    def test_convert(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_convert(self, ingest_dataset):
         """Test convert function."""
-        era5_dataset = self.ingest_dummy_data(dummy_dir)
-        era5_dataset.convert(ingest_dir=Path(dummy_dir), convention="ALMA")
+        ingest_dir, era5_dataset = ingest_dataset(ERA5)
+        era5_dataset.convert(ingest_dir=ingest_dir, convention="ALMA")
         # TODO: finish this test when the function is complete.
@@ -1,21 +1,22 @@
 """Unit test for ETH canopy height dataset."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
+import h5netcdf
 import numpy as np
 import pytest
 import xarray as xr
+from tests import assert_coords
 from tests import data_folder
+from tests import read_properties
 from zampy.datasets import eth_canopy_height
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 
 
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
+# regridded coordinates expected from test_load
+EXPECTED_LAT = np.array([59.7, 59.8, 59.9])
+EXPECTED_LON = np.array([0.0, 0.1, 0.2])
 
 
 class TestEthCanopyHeight:
@@ -44,45 +45,38 @@ class TestEthCanopyHeight:
         assert mock_urlretrieve.called
 
         # check property file
-        with (download_dir / "eth-canopy-height" / "properties.json").open(
-            mode="r", encoding="utf-8"
-        ) as file:
-            json_dict = json.load(file)
-            # check property
-            assert json_dict["variable_names"] == variable
-
-    def ingest_dummy_data(self, temp_dir):
-        """Ingest dummy tif data to nc for other tests."""
-        canopy_height_dataset = eth_canopy_height.EthCanopyHeight()
-        canopy_height_dataset.ingest(
-            download_dir=data_folder, ingest_dir=Path(temp_dir)
-        )
-
-        return canopy_height_dataset
+        json_dict = read_properties(download_dir / "eth-canopy-height")
+        assert json_dict["variable_names"] == variable
 
-    def test_ingest(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_ingest(self, ingest_dataset):
         """Test ingest function."""
-        _ = self.ingest_dummy_data(dummy_dir)
-        ds = xr.open_dataset(
+        ingest_dir, _ = ingest_dataset(eth_canopy_height.EthCanopyHeight)
+        with xr.open_dataset(
             Path(
-                dummy_dir,
+                ingest_dir,
                 "eth-canopy-height",
                 "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.nc",
-            )
-        )
-
-        assert isinstance(ds, xr.Dataset)
-
-    def test_load(self, dummy_dir):
+            ),
+            engine="h5netcdf",
+        ) as ds:
+            assert "height_of_vegetation" in ds.data_vars
+            # one time step per chunk, the 4x4 test grid fits in a single block
+            assert ds["height_of_vegetation"].encoding["chunksizes"] == (1, 4, 4)
+
+    @pytest.mark.slow  # ingests the test data
+    def test_load(self, ingest_dataset):
         """Test load function."""
-        canopy_height_dataset = self.ingest_dummy_data(dummy_dir)
+        ingest_dir, canopy_height_dataset = ingest_dataset(
+            eth_canopy_height.EthCanopyHeight
+        )
 
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["height_of_vegetation"]
 
         ds = canopy_height_dataset.load(
-            ingest_dir=Path(dummy_dir),
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -90,40 +84,28 @@ class TestEthCanopyHeight:
         )
 
         # we assert the regridded coordinates
-        expected_lat = [59.7, 59.8, 59.9]
-        expected_lon = [0.0, 0.1, 0.2]
-
-        np.testing.assert_allclose(ds.latitude.values, expected_lat)
-        np.testing.assert_allclose(ds.longitude.values, expected_lon)
+        assert_coords(ds, EXPECTED_LAT, EXPECTED_LON)
 
-    def test_convert(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_convert(self, ingest_dataset):
         """Test convert function."""
-        canopy_height_dataset = self.ingest_dummy_data(dummy_dir)
-        canopy_height_dataset.convert(ingest_dir=Path(dummy_dir), convention="ALMA")
+        ingest_dir, canopy_height_dataset = ingest_dataset(
+            eth_canopy_height.EthCanopyHeight
+        )
+        canopy_height_dataset.convert(ingest_dir=ingest_dir, convention="ALMA")
         # TODO: finish this test when the function is complete.
 
 
-def test_get_filenames():
-    """Test file names generator."""
-    bbox = SpatialBounds(54, 8, 51, 3)
-    expected = [
-        "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif",
-        "ETH_GlobalCanopyHeight_10m_2020_N51E006_Map.tif",
-    ]
-
-    file_names = eth_canopy_height.get_filenames(bbox)
-    assert file_names == expected
-
-
-def test_get_filenames_sd():
-    """Test file names of standard deviation."""
+@pytest.mark.parametrize("sd_file, suffix", [(False, "Map"), (True, "Map_SD")])
+def test_get_filenames(sd_file, suffix):
+    """Test file names generator, for the data and the standard deviation files."""
     bbox = SpatialBounds(54, 8, 51, 3)
     expected = [
-        "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map_SD.tif",
-        "ETH_GlobalCanopyHeight_10m_2020_N51E006_Map_SD.tif",
+        f"ETH_GlobalCanopyHeight_10m_2020_N51E003_{suffix}.tif",
+        f"ETH_GlobalCanopyHeight_10m_2020_N51E006_{suffix}.tif",
     ]
 
-    file_names = eth_canopy_height.get_filenames(bbox, sd_file=True)
+    file_names = eth_canopy_height.get_filenames(bbox, sd_file=sd_file)
     assert file_names == expected
 
 
@@ -146,14 +128,14 @@ def test_valid_filenames():
 
 def test_parse_tiff_file():
     """Test tiff file parser."""
-    dummy_ds = eth_canopy_height.parse_tiff_file(
+    with eth_canopy_height.parse_tiff_file(
         Path(
             data_folder,
             "eth-canopy-height",
             "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.tif",
         )
-    )
-    assert isinstance(dummy_ds, xr.Dataset)
+    ) as dummy_ds:
+        assert "height_of_vegetation" in dummy_ds.data_vars
 
 
 def test_convert_tiff_to_netcdf(dummy_dir):
@@ -168,7 +150,9 @@ def test_convert_tiff_to_netcdf(dummy_dir):
         file=dummy_data,
     )
 
-    ds = xr.open_dataset(
-        Path(dummy_dir, "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.nc")
-    )
-    assert isinstance(ds, xr.Dataset)
+    # only the file header is checked, so skip xarray's decoding
+    with h5netcdf.File(
+        Path(dummy_dir, "ETH_GlobalCanopyHeight_10m_2020_N51E003_Map.nc"), mode="r"
+    ) as file:
+        assert "height_of_vegetation" in file.variables
+        assert file["height_of_vegetation"].attrs["units"] == "meter"
@@ -1,31 +1,35 @@
 """Unit tests for the FAPAR-LAI dataset."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
 import numpy as np
 import pytest
 import xarray as xr
+from tests import assert_coords
 from tests import data_folder
+from tests import read_properties
 from zampy.datasets.catalog import FaparLAI
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 
 
-@pytest.fixture(scope="function")
-def valid_path_config(tmp_path_factory):
-    """Create a dummy .zampy_config file."""
-    fn = tmp_path_factory.mktemp("usrhome") / "zampy_config.yml"
-    with open(fn, mode="w", encoding="utf-8") as f:
-        f.write("cdsapi:\n  url: a\n  key: 123:abc-def\n")
-        f.write("adsapi:\n  url: a\n  key: 123:abc-def")
-    return fn
+BBOX = SpatialBounds(60, 10, 50, 0)
+EXPECTED_LAI_REQUEST = {
+    "format": "zip",
+    "variable": "lai",
+    "horizontal_resolution": "1km",
+    "product_version": "v3",
+    "satellite": "proba",
+    "sensor": "vgt",
+    "month": "01",
+    "nominal_day": ["10", "20", "31"],
+    "year": "2020",
+    "area": [BBOX.north, BBOX.west, BBOX.south, BBOX.east],
+}
 
-
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
+# regridded coordinates expected from test_load
+EXPECTED_LAT = np.array([59.7, 59.8, 59.9])
+EXPECTED_LON = np.array([0.0, 0.1, 0.2])
 
 
 class TestFaparLAI:
@@ -37,7 +41,6 @@ class TestFaparLAI:
         Here we mock the downloading and save property file to a fake path.
         """
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-31"))
-        bbox = SpatialBounds(60, 10, 50, 0)
         variable = ["leaf_area_index"]
         download_dir = Path(dummy_dir, "download")
 
@@ -48,63 +51,54 @@ class TestFaparLAI:
             lai_dataset.download(
                 download_dir=download_dir,
                 time_bounds=times,
-                spatial_bounds=bbox,
+                spatial_bounds=BBOX,
                 variable_names=variable,
                 overwrite=True,
             )
 
             # make sure that the download is called
-            mock_retrieve.assert_called_once_with(
+            mock_retrieve.assert_called_once()
+            assert mock_retrieve.call_args.args == (
                 "satellite-lai-fapar",
-                {
-                    "format": "zip",
-                    "variable": "lai",
-                    "horizontal_resolution": "1km",
-                    "product_version": "v3",
-                    "satellite": "proba",
-                    "sensor": "vgt",
-                    "month": "01",
-                    "nominal_day": ["10", "20", "31"],
-                    "year": "2020",
-                    "area": [
-                        bbox.north,
-                        bbox.west,
-                        bbox.south,
-                        bbox.east,
-                    ],
-                },
+                EXPECTED_LAI_REQUEST,
             )
+            assert mock_retrieve.call_args.kwargs == {}
 
             # check property file
-            with (download_dir / "fapar-lai" / "properties.json").open(
-                mode="r", encoding="utf-8"
-            ) as file:
-                json_dict = json.load(file)
-                # check property
-                assert json_dict["variable_names"] == variable
-
-    def test_ingest(self, dummy_dir):
-        """Test ingest function."""
+            json_dict = read_properties(download_dir / "fapar-lai")
+            assert json_dict["variable_names"] == variable
 
-        lai_dataset = FaparLAI()
-        lai_dataset.ingest(download_dir=data_folder, ingest_dir=dummy_dir)
-
-        ds = xr.open_mfdataset(
-            (dummy_dir / "fapar-lai").glob("*.nc"), engine="h5netcdf"
-        )
-        assert isinstance(ds, xr.Dataset)
-
-    def test_load(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_ingest(self, ingest_dataset):
+        """Test ingest function."""
+        ingest_dir, _ = ingest_dataset(FaparLAI)
+        paths = sorted((ingest_dir / "fapar-lai").glob("*.nc"))
+        assert len(paths) > 0
+
+        with xr.open_mfdataset(
+            paths,
+            chunks={"time": -1},
+            parallel=True,
+            combine="by_coords",
+            engine="h5netcdf",
+        ) as ds:
+            assert "leaf_area_index" in ds.data_vars
+
+        with xr.open_dataset(paths[0], engine="h5netcdf") as ds:
+            # one time step per chunk, the 100x100 test grid fits in a single block
+            assert ds["leaf_area_index"].encoding["chunksizes"] == (1, 100, 100)
+
+    @pytest.mark.slow  # ingests the test data
+    def test_load(self, ingest_dataset):
         """Test load function."""
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["leaf_area_index"]
 
-        lai_dataset = FaparLAI()
-        lai_dataset.ingest(download_dir=data_folder, ingest_dir=dummy_dir)
+        ingest_dir, lai_dataset = ingest_dataset(FaparLAI)
 
         ds = lai_dataset.load(
-            ingest_dir=dummy_dir,
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -112,11 +106,7 @@ class TestFaparLAI:
         )
 
         # we assert the regridded coordinates
-        expected_lat = [59.7, 59.8, 59.9]
-        expected_lon = [0.0, 0.1, 0.2]
-
-        np.testing.assert_allclose(ds.latitude.values, expected_lat)
-        np.testing.assert_allclose(ds.longitude.values, expected_lon)
+        assert_coords(ds, EXPECTED_LAT, EXPECTED_LON)
 
     @pytest.mark.slow  # depends on ingested data being available
     def test_convert(self):
@@ -1,33 +1,34 @@
 """Unit test for land cover dataset."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
 import numpy as np
 import pytest
 import xarray as xr
 import zampy.datasets.land_cover
+from tests import assert_coords
 from tests import data_folder
+from tests import read_properties
 from zampy.datasets.catalog import LandCover
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 from zampy.datasets.land_cover import get_unique_values
 
 
-@pytest.fixture(scope="function")
-def valid_path_config(tmp_path_factory):
-    """Create a dummy .zampy_config file."""
-    fn = tmp_path_factory.mktemp("usrhome") / "zampy_config.yml"
-    with open(fn, mode="w", encoding="utf-8") as f:
-        f.write("cdsapi:\n  url: a\n  key: 123:abc-def\n")
-        f.write("adsapi:\n  url: a\n  key: 123:abc-def")
-    return fn
+pytestmark = pytest.mark.xdist_group("land_cover_io")
 
+# regridded coordinates expected from test_load
+EXPECTED_LAT = np.array([59.7, 59.8, 59.9])
+EXPECTED_LON = np.array([0.0, 0.1, 0.2])
 
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
+
+def open_ingested(ingest_dir: Path) -> xr.Dataset:
+    """Open the ingested dummy land cover file."""
+    return xr.open_dataset(
+        ingest_dir / "land-cover" / "land-cover_LCCS_MAP_300m_2020.nc",
+        chunks={},
+        engine="h5netcdf",
+    )
 
 
 class TestLandCover:
@@ -68,44 +69,32 @@ class TestLandCover:
             )
 
             # check property file
-            with (download_dir / "land-cover" / "properties.json").open(
-                mode="r", encoding="utf-8"
-            ) as file:
-                json_dict = json.load(file)
-                # check property
-                assert json_dict["variable_names"] == variable
-
-    def ingest_dummy_data(self, temp_dir):
-        """Ingest dummy zip data to nc for other tests."""
-        land_cover_dataset = LandCover()
-        land_cover_dataset.ingest(download_dir=data_folder, ingest_dir=Path(temp_dir))
-        ds = xr.open_dataset(
-            Path(
-                temp_dir,
-                "land-cover",
-                "land-cover_LCCS_MAP_300m_2020.nc",
-            )
-        )
-
-        return ds, land_cover_dataset
+            json_dict = read_properties(download_dir / "land-cover")
+            assert json_dict["variable_names"] == variable
 
     @pytest.mark.slow
-    def test_ingest(self, dummy_dir):
+    def test_ingest(self, ingest_dataset):
         """Test ingest function."""
-        ds, _ = self.ingest_dummy_data(dummy_dir)
-        assert isinstance(ds, xr.Dataset)
+        ingest_dir, _ = ingest_dataset(LandCover)
+        with open_ingested(ingest_dir) as ds:
+            assert "land_cover" in ds.data_vars
+            # one time step per chunk, the 6x6 test grid fits in a single block
+            assert ds["land_cover"].encoding["chunksizes"] == (1, 6, 6)
+            assert ds["land_cover"].dtype == np.uint8
 
     @pytest.mark.slow
-    def test_load(self, dummy_dir):
+    def test_load(self, ingest_dataset):
         """Test load function."""
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["land_cover"]
 
-        ingest_ds, land_cover_dataset = self.ingest_dummy_data(dummy_dir)
+        ingest_dir, land_cover_dataset = ingest_dataset(LandCover)
+        with open_ingested(ingest_dir) as ingest_ds:
+            flag_values = ingest_ds["land_cover"].attrs["flag_values"]
 
         ds = land_cover_dataset.load(
-            ingest_dir=Path(dummy_dir),
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -113,36 +102,34 @@ class TestLandCover:
         )
 
         # we assert the regridded coordinates
-        expected_lat = [59.7, 59.8, 59.9]
-        expected_lon = [0.0, 0.1, 0.2]
-
-        np.testing.assert_allclose(ds.latitude.values, expected_lat)
-        np.testing.assert_allclose(ds.longitude.values, expected_lon)
+        assert_coords(ds, EXPECTED_LAT, EXPECTED_LON)
 
         # check if unique values of ds are a subset of ingest_ds
         assert np.all(
             np.isin(
                 np.unique(ds.land_cover.values),
-                ingest_ds["land_cover"].attrs["flag_values"],
+                flag_values,
+                assume_unique=True,
             )
         )
 
-    def test_land_cover_without_flag_values(self, dummy_dir):
+    @pytest.mark.slow
+    def test_land_cover_without_flag_values(self, ingest_dataset):
         """Test load function."""
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["land_cover"]
 
-        ingest_ds, land_cover_dataset = self.ingest_dummy_data(dummy_dir)
-
-        # store unique values
-        unique_values = ingest_ds["land_cover"].attrs["flag_values"]
+        ingest_dir, land_cover_dataset = ingest_dataset(LandCover)
+        with open_ingested(ingest_dir) as ingest_ds:
+            # store unique values
+            unique_values = ingest_ds["land_cover"].attrs["flag_values"]
 
-        # remove flag_values
-        ingest_ds["land_cover"].attrs.pop("flag_values")
+            # remove flag_values
+            ingest_ds["land_cover"].attrs.pop("flag_values")
 
         ds = land_cover_dataset.load(
-            ingest_dir=Path(dummy_dir),
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -154,14 +141,15 @@ class TestLandCover:
             np.isin(
                 np.unique(ds.land_cover.values),
                 unique_values,
+                assume_unique=True,
             )
         )
 
     @pytest.mark.slow
-    def test_convert(self, dummy_dir):
+    def test_convert(self, ingest_dataset):
         """Test convert function."""
-        _, land_cover_dataset = self.ingest_dummy_data(dummy_dir)
-        land_cover_dataset.convert(ingest_dir=Path(dummy_dir), convention="ALMA")
+        ingest_dir, land_cover_dataset = ingest_dataset(LandCover)
+        land_cover_dataset.convert(ingest_dir=ingest_dir, convention="ALMA")
         # TODO: finish this test when the function is complete.
 
 
@@ -173,6 +161,19 @@ def test_unzip_raw_to_netcdf():
     assert isinstance(ds, xr.Dataset)
 
 
+@pytest.mark.slow
+def test_extract_netcdf_to_zampy_from_disk(monkeypatch):
+    """Test that extracting the archived file to disk gives the in-memory result."""
+    file = data_folder / "land-cover/land-cover_LCCS_MAP_300m_2020.zip"
+    ds_memory = zampy.datasets.land_cover.extract_netcdf_to_zampy(file)
+
+    monkeypatch.setattr(zampy.datasets.land_cover, "IN_MEMORY_MAX_SIZE", 0)
+    ds_disk = zampy.datasets.land_cover.extract_netcdf_to_zampy(file)
+
+    xr.testing.assert_identical(ds_disk.load(), ds_memory.load())
+    assert ds_disk["land_cover"].encoding == ds_memory["land_cover"].encoding
+
+
 @pytest.mark.slow
 def test_extract_netcdf_to_zampy(dummy_dir):
     zampy.datasets.land_cover.unzip_raw_to_netcdf(
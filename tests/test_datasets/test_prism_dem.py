@@ -1,21 +1,22 @@
 """Unit test for ETH canopy height dataset."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
 import numpy as np
 import pytest
 import xarray as xr
-from tests import data_folder
+from tests import assert_coords
+from tests import read_properties
 from zampy.datasets import prism_dem
 from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 
 
-@pytest.fixture(scope="function")
-def dummy_dir(tmp_path_factory):
-    """Create a dummpy directory for testing."""
-    return tmp_path_factory.mktemp("data")
+pytestmark = pytest.mark.xdist_group("prism_dem_io")
+
+# regridded coordinates expected from test_load
+EXPECTED_LAT = np.array([59.7, 59.95])
+EXPECTED_LON = np.array([0.0, 0.25])
 
 
 class TestPrismDEM:
@@ -44,43 +45,37 @@ class TestPrismDEM:
         assert mock_urlretrieve.called
 
         # check property file
-        with (download_dir / "prism-dem-90" / "properties.json").open(
-            mode="r", encoding="utf-8"
-        ) as file:
-            json_dict = json.load(file)
-            # check property
-            assert json_dict["variable_names"] == variable
-
-    def ingest_dummy_data(self, temp_dir):
-        """Ingest dummy tif data to nc for other tests."""
-        prism_dem_dataset = prism_dem.PrismDEM90()
-        prism_dem_dataset.ingest(download_dir=data_folder, ingest_dir=Path(temp_dir))
+        json_dict = read_properties(download_dir / "prism-dem-90")
+        assert json_dict["variable_names"] == variable
 
-        return prism_dem_dataset
-
-    def test_ingest(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_ingest(self, ingest_dataset):
         """Test ingest function."""
-        _ = self.ingest_dummy_data(dummy_dir)
-        ds = xr.open_dataset(
+        ingest_dir, _ = ingest_dataset(prism_dem.PrismDEM90)
+        with xr.open_dataset(
             Path(
-                dummy_dir,
+                ingest_dir,
                 "prism-dem-90",
                 "Copernicus_DSM_30_N50_00_E000_00.nc",
-            )
-        )
-
-        assert isinstance(ds, xr.Dataset)
-
-    def test_load(self, dummy_dir):
+            ),
+            chunks={},
+            engine="h5netcdf",
+        ) as ds:
+            assert "elevation" in ds.data_vars
+            # the 100x100 test tile fits in a single 256x256 chunk
+            assert ds["elevation"].encoding["chunksizes"] == (100, 100)
+
+    @pytest.mark.slow  # ingests the test data
+    def test_load(self, ingest_dataset):
         """Test load function."""
-        prism_dem_dataset = self.ingest_dummy_data(dummy_dir)
+        ingest_dir, prism_dem_dataset = ingest_dataset(prism_dem.PrismDEM90)
 
         times = TimeBounds(np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
         bbox = SpatialBounds(60.0, 0.3, 59.7, 0.0)
         variable = ["elevation"]
 
         ds = prism_dem_dataset.load(
-            ingest_dir=Path(dummy_dir),
+            ingest_dir=ingest_dir,
             time_bounds=times,
             spatial_bounds=bbox,
             variable_names=variable,
@@ -88,14 +83,11 @@ class TestPrismDEM:
         )
 
         # we assert the regridded coordinates
-        expected_lat = [59.7, 59.95]
-        expected_lon = [0.0, 0.25]
-
-        np.testing.assert_allclose(ds["latitude"].values, expected_lat)
-        np.testing.assert_allclose(ds["longitude"].values, expected_lon)
+        assert_coords(ds, EXPECTED_LAT, EXPECTED_LON)
 
-    def test_convert(self, dummy_dir):
+    @pytest.mark.slow  # ingests the test data
+    def test_convert(self, ingest_dataset):
         """Test convert function."""
-        prism_dem_dataset = self.ingest_dummy_data(dummy_dir)
-        prism_dem_dataset.convert(ingest_dir=Path(dummy_dir), convention="ALMA")
+        ingest_dir, prism_dem_dataset = ingest_dataset(prism_dem.PrismDEM90)
+        prism_dem_dataset.convert(ingest_dir=ingest_dir, convention="ALMA")
         # TODO: finish this test when the function is complete.
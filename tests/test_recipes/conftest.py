@@ -0,0 +1,125 @@
+"""Shared fixtures for the recipe tests."""
+
+import dataclasses
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+import dask
+import dask.distributed
+import generate_test_data
+import pytest
+from zampy.datasets import DATASETS
+from zampy.datasets.dataset_protocol import SpatialBounds
+from zampy.datasets.dataset_protocol import TimeBounds
+from zampy.datasets.dataset_protocol import write_properties_file
+
+
+ERA5_SPATIAL_BOUNDS = SpatialBounds(51, 4, 50, 3)
+ERA5_VARIABLES = ["northward_component_of_wind", "surface_pressure"]
+
+
+@pytest.fixture
+def dask_client():
+    """Start a small dask cluster, which is closed again after the test.
+
+    While a client is active it is the default scheduler, so it is not kept around for
+    other tests.
+    """
+    with dask.distributed.Client(
+        n_workers=2, threads_per_worker=2, memory_limit="2GB"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _mock_era5_download():
+    """Never download ERA5 data in the recipe tests, the dummy data is used instead."""
+    with patch.object(DATASETS["era5"], "download"):
+        yield
+
+
+@pytest.fixture
+def synchronous_scheduler():
+    """Run dask computations on the synchronous scheduler.
+
+    The recipe test data is small, so a cluster or even a thread pool only adds
+    scheduling overhead.
+    """
+    with dask.config.set(scheduler="synchronous"):
+        yield
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard link a file, or copy it when the link would cross file systems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture(scope="module")
+def era5_download(request, tmp_path_factory):
+    """Generate the dummy ERA5 download data once per time range.
+
+    The generated data is stored in the pytest cache, so it is reused by later test runs
+    as well (`pytest --cache-clear` removes it). Entries are keyed on the generator
+    source too, so changing `generate_test_data` regenerates the data. Without the cache
+    plugin the data is only reused within this module.
+
+    Returns a function which links the test data for the given time bounds into a
+    download directory. The recipe ingests its data next to the download directory, so
+    every test still gets its own directory.
+    """
+    cache = getattr(request.config, "cache", None)
+    cache_dir = (
+        cache.mkdir("era5_download")
+        if cache is not None
+        else tmp_path_factory.mktemp("era5_download")
+    )
+    # changes to the generator invalidate the cached data as well
+    generator_hash = hashlib.blake2b(
+        Path(generate_test_data.__file__).read_bytes(), digest_size=8
+    ).hexdigest()
+
+    def download(download_dir: Path, time_bounds: TimeBounds) -> None:
+        key = repr(
+            (
+                str(time_bounds.start),
+                str(time_bounds.end),
+                dataclasses.astuple(ERA5_SPATIAL_BOUNDS),
+                ERA5_VARIABLES,
+                generator_hash,
+            )
+        )
+        source_dir = (
+            cache_dir / hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        )
+        if not source_dir.exists():
+            # generate next to the cache entry, so an interrupted run leaves no
+            # incomplete entry behind
+            partial_dir = Path(tempfile.mkdtemp(dir=cache_dir))
+            generate_test_data.generate_era5_files(
+                directory=partial_dir,
+                variables=ERA5_VARIABLES,
+                spatial_bounds=ERA5_SPATIAL_BOUNDS,
+                time_bounds=time_bounds,
+            )
+            write_properties_file(
+                partial_dir / "era5", ERA5_SPATIAL_BOUNDS, time_bounds, ERA5_VARIABLES
+            )
+            try:
+                partial_dir.rename(source_dir)
+            except OSError:
+                # another (xdist) worker created the same entry in the meantime
+                if not source_dir.exists():
+                    raise
+                shutil.rmtree(partial_dir)
+        # the recipe only reads the downloaded files, so hard links suffice
+        shutil.copytree(
+            source_dir / "era5", download_dir / "era5", copy_function=_link_or_copy
+        )
+
+    return download
@@ -1,6 +1,8 @@
 """Generates test data for running the recipe tests."""
 
 from pathlib import Path
+import dask
+import dask.array
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -8,14 +10,12 @@ from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
 
 
-def generate_era5_file(
-    varname: str,
+def generate_era5_coords(
     time_bounds: TimeBounds,
     spatial_bounds: SpatialBounds,
-    test_value: float,
     resolution: float,
     time_res="1H",
-) -> xr.Dataset:
+) -> dict[str, np.ndarray | pd.DatetimeIndex]:
     time_coords = pd.date_range(
         start=time_bounds.start, end=time_bounds.end, freq=time_res, inclusive="left"
     )
@@ -29,15 +29,26 @@ def generate_era5_file(
         stop=np.round(spatial_bounds.east + 1),
         step=resolution,
     )
-    data = np.zeros((len(lon_coords), len(lat_coords), len(time_coords))) + test_value
+    return {"longitude": lon_coords, "latitude": lat_coords, "time": time_coords}
+
+
+def generate_era5_file(
+    varname: str,
+    coords: dict[str, np.ndarray | pd.DatetimeIndex],
+    test_value: float,
+) -> xr.Dataset:
+    # lazy constant field, so it is written to disk one day at a time without
+    # materializing the full array in memory
+    data = dask.array.full(
+        tuple(len(coords[dim]) for dim in ("longitude", "latitude", "time")),
+        test_value,
+        dtype=np.float32,
+        chunks=(-1, -1, 24),
+    )
 
     ds = xr.Dataset(
         data_vars={ERA5_LOOKUP[varname][1]: (("longitude", "latitude", "time"), data)},
-        coords={
-            "longitude": lon_coords,
-            "latitude": lat_coords,
-            "time": time_coords,
-        },
+        coords=coords,
     )
     ds[ERA5_LOOKUP[varname][1]].attrs["units"] = ERA5_LOOKUP[varname][0]
     ds["latitude"].attrs["units"] = "degrees_north"
@@ -53,6 +64,20 @@ ERA5_LOOKUP = {  # name: (unit, fname)
 }
 
 
+def _write_era5_file(
+    directory: Path,
+    varname: str,
+    coords: dict[str, np.ndarray | pd.DatetimeIndex],
+) -> None:
+    ds = generate_era5_file(varname=varname, coords=coords, test_value=1.0)
+    # this already runs as a dask task, so write the chunks within the task itself
+    with dask.config.set(scheduler="synchronous"):
+        ds.to_netcdf(
+            path=directory / f"era5_{varname}.nc",
+            encoding={ERA5_LOOKUP[varname][1]: {"dtype": "float32"}},
+        )
+
+
 def generate_era5_files(
     directory: Path,
     variables: list[str],
@@ -62,12 +87,14 @@ def generate_era5_files(
     data_dir_era5 = directory / "era5"
     data_dir_era5.mkdir()
 
-    for var in variables:
-        ds = generate_era5_file(
-            varname=var,
-            time_bounds=time_bounds,
-            spatial_bounds=spatial_bounds,
-            test_value=1.0,
-            resolution=0.25,
-        )
-        ds.to_netcdf(path=data_dir_era5 / f"era5_{var}.nc")
+    # all variables share the same coordinates, so only compute them once
+    coords = generate_era5_coords(
+        time_bounds=time_bounds, spatial_bounds=spatial_bounds, resolution=0.25
+    )
+
+    # the files are independent, so write them in parallel (on the dask client if one
+    # is running)
+    writes = [
+        dask.delayed(_write_era5_file)(data_dir_era5, var, coords) for var in variables
+    ]
+    dask.compute(*writes)
@@ -1,7 +1,9 @@
 """Test the recipe loader."""
 
 import pytest
+import yaml
 from zampy.recipe import recipe_loader
+from zampy.recipe import validate_recipe
 
 
 valid_recipe = """
@@ -69,13 +71,18 @@ def test_valid_recipe(tmp_path):
     recipe_loader(recipe_path)
 
 
-@pytest.mark.parametrize(
-    "recipe", [recipe_missing_convention, recipe_missing_datasets, recipe_missing_name]
-)
-def test_invalid_recipes(tmp_path, recipe):
-    recipe_path = tmp_path / "invalid_recipe.yml"
-    with recipe_path.open("w") as f:
-        f.write(recipe)
+# parse the invalid recipes once, they only have to be validated by the tests
+INVALID_RECIPES = [
+    yaml.safe_load(recipe)
+    for recipe in (
+        recipe_missing_convention,
+        recipe_missing_datasets,
+        recipe_missing_name,
+    )
+]
+
 
+@pytest.mark.parametrize("recipe", INVALID_RECIPES)
+def test_invalid_recipes(recipe):
     with pytest.raises(ValueError):
-        recipe_loader(recipe_path)
+        validate_recipe(recipe)
@@ -1,210 +1,109 @@
 """Testing a simple recipe."""
 
+import dataclasses
 from pathlib import Path
-from unittest.mock import patch
-import dask.distributed
-import generate_test_data
 import numpy as np
 import pytest
 import xarray as xr
-from zampy.datasets import DATASETS
-from zampy.datasets.dataset_protocol import SpatialBounds
 from zampy.datasets.dataset_protocol import TimeBounds
-from zampy.datasets.dataset_protocol import write_properties_file
 from zampy.recipe import RecipeManager
 from zampy.recipe import convert_time
 
 
-RECIPE_FILE = Path(__file__).parent / "recipes" / "era5_recipe.yml"
-
-
-def test_recipe(tmp_path: Path, mocker):
-    with (
-        patch.object(DATASETS["era5"], "download"),
-    ):
-        dask.distributed.Client()
-
-        mocker.patch(
-            "zampy.recipe.config_loader",
-            return_value={"working_directory": str(tmp_path.absolute())},
-        )
-        rm = RecipeManager(RECIPE_FILE.absolute())
-
-        spatial_bounds = SpatialBounds(51, 4, 50, 3)
-        time_bounds = TimeBounds(
-            np.datetime64("2020-01-01T00:00"), np.datetime64("2020-12-31T23:59")
-        )
-        variables = ["northward_component_of_wind", "surface_pressure"]
-
-        generate_test_data.generate_era5_files(
-            directory=tmp_path / "download",
-            variables=variables,
-            spatial_bounds=spatial_bounds,
-            time_bounds=time_bounds,
-        )
-        write_properties_file(
-            tmp_path / "download" / "era5", spatial_bounds, time_bounds, variables
-        )
-
-        rm.run()
-
-        ds = xr.open_mfdataset(
-            str(tmp_path / "output" / "era5_recipe" / "*.nc"), engine="h5netcdf"
-        )
-        assert all(var in ds.data_vars for var in ["Psurf", "Wind_N"])
-        # Check if time frequency is correct
-        assert ds.time.diff("time").min() == np.timedelta64(1, "h")
-
-
-def test_recipe_with_lower_frequency(tmp_path: Path, mocker):
-    with (
-        patch.object(DATASETS["era5"], "download"),
-    ):
-        dask.distributed.Client()
-
-        mocker.patch(
-            "zampy.recipe.config_loader",
-            return_value={"working_directory": str(tmp_path.absolute())},
-        )
-        rm = RecipeManager(RECIPE_FILE.absolute())
-        rm.frequency = "6h"  # change the frequency of the recipe
-
-        spatial_bounds = SpatialBounds(51, 4, 50, 3)
-        time_bounds = TimeBounds(
-            np.datetime64("2020-01-01T00:00"), np.datetime64("2020-01-01T23:59")
-        )
-        variables = ["northward_component_of_wind", "surface_pressure"]
-
-        generate_test_data.generate_era5_files(
-            directory=tmp_path / "download",
-            variables=variables,
-            spatial_bounds=spatial_bounds,
-            time_bounds=time_bounds,
-        )
-        write_properties_file(
-            tmp_path / "download" / "era5", spatial_bounds, time_bounds, variables
-        )
-
-        rm.run()
-
-        ds = xr.open_mfdataset(
-            str(tmp_path / "output" / "era5_recipe" / "*.nc"), engine="h5netcdf"
-        )
-        # check the lenght of the time dimension, mean values are used
-        assert len(ds.time) == 4
-
-
-def test_recipe_with_higher_frequency(tmp_path: Path, mocker):
-    with (
-        patch.object(DATASETS["era5"], "download"),
-    ):
-        dask.distributed.Client()
-
-        mocker.patch(
-            "zampy.recipe.config_loader",
-            return_value={"working_directory": str(tmp_path.absolute())},
-        )
-        rm = RecipeManager(RECIPE_FILE.absolute())
-        rm.frequency = "30min"  # change the frequency of the recipe
-
-        spatial_bounds = SpatialBounds(51, 4, 50, 3)
-        time_bounds = TimeBounds(
-            np.datetime64("2020-01-01T00:00"), np.datetime64("2020-01-01T23:59")
-        )
-        variables = ["northward_component_of_wind", "surface_pressure"]
-
-        generate_test_data.generate_era5_files(
-            directory=tmp_path / "download",
-            variables=variables,
-            spatial_bounds=spatial_bounds,
-            time_bounds=time_bounds,
-        )
-        write_properties_file(
-            tmp_path / "download" / "era5", spatial_bounds, time_bounds, variables
-        )
-
-        rm.run()
-
-        ds = xr.open_mfdataset(
-            str(tmp_path / "output" / "era5_recipe" / "*.nc"), engine="h5netcdf"
-        )
-        # check the lenght of the time dimension, data is interpolated
-        assert len(ds.time) == 47
-
-
-def test_recipe_with_two_time_values(tmp_path: Path, mocker):
-    with (
-        patch.object(DATASETS["era5"], "download"),
-    ):
-        dask.distributed.Client()
-
-        mocker.patch(
-            "zampy.recipe.config_loader",
-            return_value={"working_directory": str(tmp_path.absolute())},
-        )
-        rm = RecipeManager(RECIPE_FILE.absolute())
-
-        spatial_bounds = SpatialBounds(51, 4, 50, 3)
-        time_bounds = TimeBounds(
-            np.datetime64("2020-01-01T00:00"), np.datetime64("2020-01-01T02:00")
-        )
-        variables = ["northward_component_of_wind", "surface_pressure"]
-
-        generate_test_data.generate_era5_files(
-            directory=tmp_path / "download",
-            variables=variables,
-            spatial_bounds=spatial_bounds,
-            time_bounds=time_bounds,
-        )
-        write_properties_file(
-            tmp_path / "download" / "era5", spatial_bounds, time_bounds, variables
-        )
-
-        rm.run()
+pytestmark = pytest.mark.xdist_group("recipe_io")
 
-        ds = xr.open_mfdataset(
-            str(tmp_path / "output" / "era5_recipe" / "*.nc"), engine="h5netcdf"
-        )
-        # check the lenght of the time dimension
-        assert len(ds.time) == 2
-
-
-def test_recipe_with_one_time_values(tmp_path: Path, mocker):
-    with (
-        patch.object(DATASETS["era5"], "download"),
-    ):
-        dask.distributed.Client()
+RECIPE_FILE = Path(__file__).parent / "recipes" / "era5_recipe.yml"
 
+TIME_YEAR = TimeBounds(
+    np.datetime64("2020-01-01T00:00"), np.datetime64("2020-12-31T23:59")
+)
+TIME_DAY = dataclasses.replace(TIME_YEAR, end=np.datetime64("2020-01-01T23:59"))
+
+
+def _open_output(working_directory: Path) -> xr.Dataset:
+    """Open the output of the ERA5 recipe, which is usually a single file."""
+    files = sorted((working_directory / "output" / "era5_recipe").glob("*.nc"))
+    if len(files) == 1:
+        return xr.open_dataset(files[0], engine="h5netcdf", chunks={})
+    return xr.open_mfdataset(
+        files,
+        engine="h5netcdf",
+        parallel=True,
+        combine="by_coords",
+        chunks={},
+        data_vars="minimal",
+        coords="minimal",
+        compat="override",
+    )
+
+
+@pytest.fixture
+def run_recipe(tmp_path: Path, mocker, era5_download):
+    """Run the ERA5 recipe on dummy data, and return the opened output.
+
+    Returns a function which takes the time bounds of the dummy download data and
+    optionally a different recipe frequency.
+    """
+
+    def run(time_bounds: TimeBounds, frequency: str | None = None) -> xr.Dataset:
         mocker.patch(
             "zampy.recipe.config_loader",
             return_value={"working_directory": str(tmp_path.absolute())},
         )
         rm = RecipeManager(RECIPE_FILE.absolute())
+        if frequency is not None:
+            rm.frequency = frequency  # change the frequency of the recipe
 
-        spatial_bounds = SpatialBounds(51, 4, 50, 3)
-        time_bounds = TimeBounds(
-            np.datetime64("2020-01-01T00:00"), np.datetime64("2020-01-01T00:00")
-        )
-        variables = ["northward_component_of_wind", "surface_pressure"]
-
-        generate_test_data.generate_era5_files(
-            directory=tmp_path / "download",
-            variables=variables,
-            spatial_bounds=spatial_bounds,
-            time_bounds=time_bounds,
-        )
-        write_properties_file(
-            tmp_path / "download" / "era5", spatial_bounds, time_bounds, variables
-        )
+        era5_download(tmp_path / "download", time_bounds)
 
         rm.run()
 
-        ds = xr.open_mfdataset(
-            str(tmp_path / "output" / "era5_recipe" / "*.nc"), engine="h5netcdf"
-        )
-        # check the lenght of the time dimension, should not do interpolation or
-        # extrapolation in time
-        assert len(ds.time) == 1
+        return _open_output(tmp_path)
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "scheduler",
+    ["synchronous_scheduler", pytest.param("dask_client", marks=pytest.mark.slow)],
+)
+def test_recipe(run_recipe, request, scheduler):
+    # run the full recipe once on a distributed cluster as well
+    request.getfixturevalue(scheduler)
+    ds = run_recipe(TIME_YEAR)
+    assert all(var in ds.data_vars for var in ["Psurf", "Wind_N"])
+    # Check if time frequency is correct
+    assert ds.time.diff("time").min() == np.timedelta64(1, "h")
+
+
+@pytest.mark.parametrize(
+    "frequency, time_bounds, expected_len",
+    [
+        # lower frequency, mean values are used
+        pytest.param("6h", TIME_DAY, 4, id="lower_frequency"),
+        # higher frequency, data is interpolated
+        pytest.param("30min", TIME_DAY, 47, id="higher_frequency"),
+        pytest.param(
+            None,
+            dataclasses.replace(TIME_DAY, end=np.datetime64("2020-01-01T02:00")),
+            2,
+            id="two_time_values",
+        ),
+        # should not do interpolation or extrapolation in time
+        pytest.param(
+            None,
+            dataclasses.replace(TIME_DAY, end=TIME_DAY.start),
+            1,
+            id="one_time_value",
+        ),
+    ],
+)
+def test_recipe_time_length(
+    run_recipe, synchronous_scheduler, frequency, time_bounds, expected_len
+):
+    ds = run_recipe(time_bounds, frequency=frequency)
+    # check the lenght of the time dimension
+    assert len(ds.time) == expected_len
 
 
 def test_invalid_time_format():
@@ -1,9 +1,15 @@
 """Unit test for utils functions."""
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
+import numpy as np
+import pytest
+import xarray as xr
+import xarray_regrid
 from zampy.datasets import utils
+from zampy.datasets.dataset_protocol import SpatialBounds
 
 
 def test_tqdm_update():
@@ -38,8 +44,8 @@ def test_get_file_size():
     """Create a temporary file with a size of 1024 bytes."""
     with tempfile.NamedTemporaryFile() as temp_file:
         temp_path = Path(temp_file.name)
-        temp_file.write(b"0" * 1024)
-        temp_file.flush()
+        # set the file length directly, without writing any bytes
+        os.ftruncate(temp_file.fileno(), 1024)
 
         # Call the get_file_size() function
         size = utils.get_file_size(temp_path)
@@ -66,3 +72,26 @@ def test_download_url(mock_urlretrieve):
     utils.download_url(url, fpath, overwrite)
     # assrt that the urlretrieve function is called.
     assert mock_urlretrieve.called
+
+
+def test_chunk_sizes():
+    """Test chunk sizes of a time, latitude, longitude array."""
+    da = xr.DataArray(np.zeros((3, 200, 50)), dims=("time", "latitude", "longitude"))
+    assert utils.chunk_sizes(da) == (1, 128, 50)
+    assert utils.chunk_sizes(da, time_chunk=2) == (2, 128, 50)
+    assert utils.chunk_sizes(da, time_chunk=None) == (3, 128, 50)
+
+
+@pytest.fixture(scope="session", params=[(SpatialBounds(54, 6, 51, 3), 1.0)])
+def new_grid(request):
+    """Regridding target dataset, built once per session for each bounds/resolution."""
+    spatial_bounds, resolution = request.param
+    return xarray_regrid.create_regridding_dataset(
+        utils.make_grid(spatial_bounds, resolution)
+    )
+
+
+def test_make_grid(new_grid):
+    """Test the coordinates of the regridding target."""
+    np.testing.assert_allclose(new_grid["latitude"].values, np.arange(51.0, 55.0))
+    np.testing.assert_allclose(new_grid["longitude"].values, np.arange(3.0, 7.0))